@@ -13,9 +13,17 @@ from darts.ad.scorers.scorers import AnomalyScorer
 
 
 class DifferenceScorer(AnomalyScorer):
-    def __init__(self) -> None:
-        """Difference Scorer"""
-        super().__init__(is_univariate=False, window=1)
+    def __init__(self, n_jobs: int = 1) -> None:
+        """Difference Scorer
+
+        Parameters
+        ----------
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a `Sequence[TimeSeries]` is
+            passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
+        """
+        super().__init__(is_univariate=False, window=1, n_jobs=n_jobs)
 
     def __str__(self):
         return "Difference"
@@ -15,9 +15,23 @@ from darts.ad.scorers.scorers import NLLScorer
 
 
 class CauchyNLLScorer(NLLScorer):
-    def __init__(self, window: int = 1) -> None:
-        """NLL Cauchy Scorer"""
-        super().__init__(window=window)
+    def __init__(self, window: int = 1, n_jobs: int = 1) -> None:
+        """NLL Cauchy Scorer
+
+        Parameters
+        ----------
+        window
+            Integer value indicating the size of the window W used by the scorer to transform the series into an
+            anomaly score. A scorer will slice the given series into subsequences of size W and returns a value
+            indicating how anomalous these subset of W values are. A post-processing step will convert this anomaly
+            score into a point-wise anomaly score (see definition of `window_transform`). The window size should be
+            commensurate to the expected durations of the anomalies one is looking for.
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a `Sequence[TimeSeries]` is
+            passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
+        """
+        super().__init__(window=window, n_jobs=n_jobs)
 
     def __str__(self):
         return "CauchyNLLScorer"
@@ -15,7 +15,7 @@ from darts.ad.scorers.scorers import NLLScorer
 
 
 class GammaNLLScorer(NLLScorer):
-    def __init__(self, window: int = 1) -> None:
+    def __init__(self, window: int = 1, n_jobs: int = 1) -> None:
         """NLL Gamma Scorer
 
         Parameters
@@ -26,8 +26,12 @@ class GammaNLLScorer(NLLScorer):
             indicating how anomalous these subset of W values are. A post-processing step will convert this anomaly
             score into a point-wise anomaly score (see definition of `window_transform`). The window size should be
             commensurate to the expected durations of the anomalies one is looking for.
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a `Sequence[TimeSeries]` is
+            passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
         """
-        super().__init__(window=window)
+        super().__init__(window=window, n_jobs=n_jobs)
 
     def __str__(self):
         return "GammaNLLScorer"
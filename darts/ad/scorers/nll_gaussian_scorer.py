@@ -9,13 +9,12 @@ under a Gaussian distribution estimated from the stochastic predictions.
 """
 
 import numpy as np
-from scipy.stats import norm
 
 from darts.ad.scorers.scorers import NLLScorer
 
 
 class GaussianNLLScorer(NLLScorer):
-    def __init__(self, window: int = 1) -> None:
+    def __init__(self, window: int = 1, n_jobs: int = 1) -> None:
         """NLL Gaussian Scorer
 
         Parameters
@@ -26,8 +25,12 @@ class GaussianNLLScorer(NLLScorer):
             indicating how anomalous these subset of W values are. A post-processing step will convert this anomaly
             score into a point-wise anomaly score (see definition of `window_transform`). The window size should be
             commensurate to the expected durations of the anomalies one is looking for.
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a `Sequence[TimeSeries]` is
+            passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
         """
-        super().__init__(window=window)
+        super().__init__(window=window, n_jobs=n_jobs)
 
     def __str__(self):
         return "GaussianNLLScorer"
@@ -36,5 +39,8 @@ class GaussianNLLScorer(NLLScorer):
         self, vals: np.ndarray, pred_vals: np.ndarray
     ) -> np.ndarray:
         mu = np.mean(pred_vals, axis=1)
-        std = np.std(pred_vals, axis=1)
-        return -norm.logpdf(vals, loc=mu, scale=std)
+        var = np.var(pred_vals, axis=1)
+        # closed-form of `-scipy.stats.norm.logpdf()` without its input validation overhead; gives `nan` for a
+        # zero variance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return 0.5 * np.log(2 * np.pi * var) + (vals - mu) ** 2 / (2 * var)
@@ -9,13 +9,12 @@ under a Laplace distribution estimated from the stochastic prediction.
 """
 
 import numpy as np
-from scipy.stats import laplace
 
 from darts.ad.scorers.scorers import NLLScorer
 
 
 class LaplaceNLLScorer(NLLScorer):
-    def __init__(self, window: int = 1) -> None:
+    def __init__(self, window: int = 1, n_jobs: int = 1) -> None:
         """NLL Laplace Scorer
 
         Parameters
@@ -26,8 +25,12 @@ class LaplaceNLLScorer(NLLScorer):
             indicating how anomalous these subset of W values are. A post-processing step will convert this anomaly
             score into a point-wise anomaly score (see definition of `window_transform`). The window size should be
             commensurate to the expected durations of the anomalies one is looking for.
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a `Sequence[TimeSeries]` is
+            passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
         """
-        super().__init__(window=window)
+        super().__init__(window=window, n_jobs=n_jobs)
 
     def __str__(self):
         return "LaplaceNLLScorer"
@@ -40,5 +43,8 @@ class LaplaceNLLScorer(NLLScorer):
         # ML estimate for the Laplace scale
         # see: https://github.com/scipy/scipy/blob/de80faf9d3480b9dbb9b888568b64499e0e70c19/scipy
         # /stats/_continuous_distns.py#L4846
-        scale = np.sum(np.abs(pred_vals.T - loc), axis=0).T / pred_vals.shape[1]
-        return -laplace.logpdf(vals, loc=loc, scale=scale)
+        scale = np.mean(np.abs(pred_vals - loc[:, None]), axis=1)
+        # closed-form of `-scipy.stats.laplace.logpdf()` without its input validation overhead; gives `nan` for a
+        # zero scale
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.log(2 * scale) + np.abs(vals - loc) / scale
@@ -15,7 +15,7 @@ from darts.ad.scorers.scorers import AnomalyScorer
 
 
 class NormScorer(AnomalyScorer):
-    def __init__(self, ord=None, component_wise: bool = False) -> None:
+    def __init__(self, ord=None, component_wise: bool = False, n_jobs: int = 1) -> None:
         """Norm Scorer
 
         Returns the element-wise norm of a given order between two series' values.
@@ -45,9 +45,13 @@ class NormScorer(AnomalyScorer):
         component_wise
             Whether to compare components of the two series in isolation (`True`), or jointly (`False`).
             Default: `False`
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a `Sequence[TimeSeries]` is
+            passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
         """
         self.ord = ord
-        super().__init__(is_univariate=(not component_wise), window=1)
+        super().__init__(is_univariate=(not component_wise), window=1, n_jobs=n_jobs)
 
     def __str__(self):
         return f"Norm (ord={self.ord})"
@@ -6,7 +6,6 @@ Scorers Base Classes
 #     - add stride for Scorers like Kmeans and Wasserstein
 #     - add option to normalize the windows for kmeans? capture only the form and not the values.
 
-import copy
 import sys
 from abc import ABC, abstractmethod
 from typing import Optional, Sequence, Union
@@ -21,18 +20,20 @@ except ImportError:
     from typing_extensions import Literal
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from sklearn.base import clone
 
 from darts import TimeSeries, metrics
 from darts.ad.utils import (
     _assert_same_length,
     _check_input,
     _sanity_check_two_series,
+    _window_agg_values,
     eval_metric_from_scores,
     show_anomalies_from_scores,
 )
 from darts.logging import get_logger, raise_log
-from darts.metrics.metrics import METRIC_TYPE
-from darts.utils.data.tabularization import create_lagged_data
+from darts.metrics.metrics import METRIC_TYPE, _get_wrapped_metric
 from darts.utils.ts_utils import series2seq
 from darts.utils.utils import _build_tqdm_iterator, _parallel_apply
 
@@ -42,7 +43,7 @@ logger = get_logger(__name__)
 class AnomalyScorer(ABC):
     """Base class for all anomaly scorers"""
 
-    def __init__(self, is_univariate: bool, window: int) -> None:
+    def __init__(self, is_univariate: bool, window: int, n_jobs: int = 1) -> None:
         """
         Parameters
         ----------
@@ -54,6 +55,10 @@ class AnomalyScorer(ABC):
             indicating how anomalous these subset of W values are. A post-processing step will convert this anomaly
             score into a point-wise anomaly score (see definition of `window_transform`). The window size should be
             commensurate to the expected durations of the anomalies one is looking for.
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a `Sequence[TimeSeries]` is
+            passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
         """
         if window <= 0:
             raise_log(
@@ -64,6 +69,7 @@ class AnomalyScorer(ABC):
             )
         self.window = window
         self._is_univariate = is_univariate
+        self._n_jobs = n_jobs
 
     def score_from_prediction(
         self,
@@ -93,33 +99,24 @@ class AnomalyScorer(ABC):
         name, pred_name = "series", "pred_series"
         _assert_same_length(series, pred_series, name, pred_name)
 
-        pred_scores = []
         for actual, pred in zip(series, pred_series):
             _sanity_check_two_series(actual, pred, name, pred_name)
-            index = actual.slice_intersect_times(pred, copy=False)
-            self._check_window_size(index)
-            scores = self._score_core_from_prediction(
-                vals=actual.slice_intersect_values(pred),
-                pred_vals=pred.slice_intersect_values(actual),
-            )
-            scores = TimeSeries.from_times_and_values(
-                values=scores,
-                times=index,
-            )
 
-            if self.window > 1:
-                # apply a moving average with window size `self.window` to the anomaly scores starting at `self.window`;
-                # series of length `n` will be transformed into a series of length `n-self.window+1`.
-                scores = scores.window_transform(
-                    transforms={
-                        "window": self.window,
-                        "function": "mean",
-                        "mode": "rolling",
-                        "min_periods": self.window,
-                    },
-                    treat_na="dropna",
-                )
-            pred_scores.append(scores)
+        if self._n_jobs == 1 or len(series) == 1:
+            # avoid the overhead of spawning jobs when there is nothing to parallelize
+            pred_scores = [
+                self._score_pair(actual, pred)
+                for actual, pred in zip(series, pred_series)
+            ]
+        else:
+            # parallelize scoring of the independent series pairs
+            pred_scores = _parallel_apply(
+                zip(series, pred_series),
+                self._score_pair,
+                n_jobs=self._n_jobs,
+                fn_args=(),
+                fn_kwargs={},
+            )
         return pred_scores[0] if called_with_single_series else pred_scores
 
     def eval_metric_from_prediction(
@@ -259,6 +256,43 @@ class AnomalyScorer(ABC):
     ) -> np.ndarray:
         pass
 
+    def _score_pair(self, series: TimeSeries, pred_series: TimeSeries) -> TimeSeries:
+        """Computes the anomaly score on the time intersection of a single `series` and `pred_series` pair."""
+        index = series.slice_intersect_times(pred_series, copy=False)
+        self._check_window_size(index)
+        # reuse the time intersection: a series fully covered by it does not have to be intersected again
+        vals = (
+            series.all_values(copy=False)
+            if len(index) == len(series)
+            else series.slice_intersect_values(pred_series)
+        )
+        pred_vals = (
+            pred_series.all_values(copy=False)
+            if len(index) == len(pred_series)
+            else pred_series.slice_intersect_values(series)
+        )
+        scores = self._score_core_from_prediction(vals=vals, pred_vals=pred_vals)
+        scores = TimeSeries.from_times_and_values(values=scores, times=index)
+        if self.window == 1:
+            return scores
+
+        # apply a moving average with window size `self.window` to the anomaly scores starting at `self.window`;
+        # series of length `n` will be transformed into a series of length `n-self.window+1`. Each window is
+        # reduced on its own, so that a non-finite or very large score only affects the windows containing it.
+        # The values (in float64) and component names are the ones of a rolling mean `window_transform()`.
+        window = self.window
+        # (time, components) -> (time - (window - 1), components, window) -> (time - (window - 1), components)
+        mean_scores = sliding_window_view(
+            scores.values(copy=False), window_shape=window, axis=0
+        ).mean(axis=-1, dtype=np.float64)
+        return TimeSeries.from_times_and_values(
+            values=mean_scores,
+            times=scores._time_index[window - 1 :],
+            columns=[
+                f"rolling_mean_{window}_{window}_{name}" for name in scores.components
+            ],
+        )
+
     def _check_univariate_scorer(
         self, anomalies: Union[TimeSeries, Sequence[TimeSeries]]
     ):
@@ -273,22 +307,21 @@ class AnomalyScorer(ABC):
             False -> when the scorer will return a series that has the
                 same number of components as the input (can be univariate or multivariate).
         """
+        # the width only needs to be checked if the scorer returns a univariate score
+        extra_checks = self._check_univariate if self.is_univariate else None
+        _ = _check_input(anomalies, name="anomalies", extra_checks=extra_checks)
 
-        def _check_univariate(s: TimeSeries):
-            """Checks if `anomalies` contains only univariate series, which
-            is required if any of the scorers returns a univariate score.
-            """
-            if self.is_univariate and not s.width == 1:
-                raise_log(
-                    ValueError(
-                        f"Scorer {str(self)} will return a univariate anomaly score series (width=1). "
-                        f"Found a multivariate `anomalies`. "
-                        f"The evaluation of the accuracy cannot be computed between the two series."
-                    ),
-                    logger=logger,
-                )
-
-        _ = _check_input(anomalies, name="anomalies", extra_checks=_check_univariate)
+    def _check_univariate(self, series: TimeSeries):
+        """Checks if `series` is univariate, which is required if the scorer returns a univariate score."""
+        if series.width != 1:
+            raise_log(
+                ValueError(
+                    f"Scorer {str(self)} will return a univariate anomaly score series (width=1). "
+                    f"Found a multivariate `anomalies`. "
+                    f"The evaluation of the accuracy cannot be computed between the two series."
+                ),
+                logger=logger,
+            )
 
     def _check_window_size(self, series: Sequence):
         """Checks if the parameter window is less or equal than the length of the given series"""
@@ -315,12 +348,13 @@ class AnomalyScorer(ABC):
 
     def _extract_deterministic_series(self, series: TimeSeries, name_series: str):
         """Extract a deterministic series from `series` (quantile=0.5 if `series` is probabilistic)."""
-        if series.is_deterministic:
+        n_samples = series.n_samples
+        if n_samples == 1:
             return series
 
         logger.warning(
             f"Scorer {str(self)} is expecting `{name_series}` to be a (sequence of) deterministic "
-            f"timeseries (number of samples must be equal to 1, found: {series.n_samples}). The series "
+            f"timeseries (number of samples must be equal to 1, found: {n_samples}). The series "
             f"will be converted to a deterministic series by taking the median of the samples.",
         )
         return series.quantile_timeseries(quantile=0.5)
@@ -373,7 +407,7 @@ class FittableAnomalyScorer(AnomalyScorer):
             passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
             (sequential). Setting the parameter to `-1` means using all the available processors.
         """
-        super().__init__(is_univariate=is_univariate, window=window)
+        super().__init__(is_univariate=is_univariate, window=window, n_jobs=n_jobs)
         if diff_fn not in metrics.TIME_DEPENDENT_METRICS:
             valid_metrics = [m.__name__ for m in metrics.TIME_DEPENDENT_METRICS]
             raise_log(
@@ -385,7 +419,6 @@ class FittableAnomalyScorer(AnomalyScorer):
             )
         self.diff_fn = diff_fn
         self.window_agg = window_agg
-        self._n_jobs = n_jobs
 
         # indicates if the scorer has been trained yet
         self._fit_called = False
@@ -483,7 +516,10 @@ class FittableAnomalyScorer(AnomalyScorer):
 
         called_with_single_series = isinstance(series, TimeSeries)
         series = _check_input(
-            series, name="series", extra_checks=self._check_window_size
+            series,
+            name="series",
+            width_expected=self.width_trained_on,
+            extra_checks=self._check_window_size,
         )
         series = [self._extract_deterministic_series(s, "series") for s in series]
 
@@ -619,11 +655,7 @@ class FittableAnomalyScorer(AnomalyScorer):
         if scorer_name is None:
             scorer_name = f"anomaly score by {str(self)}"
 
-        if self.window_agg:
-            window = 1
-        else:
-            window = self.window
-
+        window = 1 if self.window_agg else self.window
         return show_anomalies_from_scores(
             series=series,
             anomalies=anomalies,
@@ -679,10 +711,24 @@ class FittableAnomalyScorer(AnomalyScorer):
         Sequence[TimeSeries]
             A sequence of series of width W from the difference between `series` and `pred_series`.
         """
-        residuals = self.diff_fn(series, pred_series, component_reduction=None)
+        _assert_same_length(series, pred_series, "series", "pred_series")
+        # bypass the metric's decorators (input handling and reductions) and compute the residuals directly
+        residuals = _parallel_apply(
+            zip(series, pred_series),
+            _get_wrapped_metric(self.diff_fn),
+            n_jobs=self._n_jobs,
+            fn_args=(),
+            fn_kwargs={},
+        )
         out = []
         for s1, s2, res in zip(series, pred_series, residuals):
-            time_index = s2.slice_intersect_times(s1, copy=False)
+            # `diff_fn` already computed the residuals on the time intersection; if it covers all of `s2`, the
+            # intersection does not have to be computed again
+            time_index = (
+                s2._time_index
+                if len(res) == len(s2)
+                else s2.slice_intersect_times(s1, copy=False)
+            )
             out.append(s2.with_times_and_values(times=time_index, values=res))
         return out
 
@@ -702,19 +748,15 @@ class FittableAnomalyScorer(AnomalyScorer):
         over the anomaly score series. The return anomaly score represents the abnormality
         of each timestamp.
         """
-        # TODO: can we use window_transform here?
-        scores_point_wise = []
-        for score in scores:
-            score_vals = score.all_values(copy=False)
-            mean_score = np.empty(score_vals.shape)
-            for idx_point in range(len(score)):
-                # "look ahead window" to account for the "look behind window" of the scorer
-                mean_score[idx_point] = score_vals[idx_point : idx_point + window].mean(
-                    axis=0
-                )
-            score_point_wise = score.with_times_and_values(score.time_index, mean_score)
-            scores_point_wise.append(score_point_wise)
-        return scores_point_wise
+        # "look ahead window" to account for the "look behind window" of the scorer
+        mean_scores = [
+            _window_agg_values(score.all_values(copy=False), window) for score in scores
+        ]
+        # the time index is unchanged, reuse the coordinates of the window-wise scores
+        return [
+            score.with_values(mean_score)
+            for score, mean_score in zip(scores, mean_scores)
+        ]
 
     def _check_fit_called(self):
         """Checks if the scorer has been fitted before calling its `score()` function."""
@@ -784,17 +826,20 @@ class WindowedAnomalyScorer(FittableAnomalyScorer):
         )
         self.model = _parallel_apply(
             input_iterator,
-            copy.deepcopy(self.model).fit,
+            self._fit_model_clone,
             n_jobs=self._n_jobs,
             fn_args=args,
             fn_kwargs=kwargs,
         )
 
+    def _fit_model_clone(self, data: np.ndarray, *args, **kwargs):
+        """Fits and returns an unfitted copy of the scorer model, so that each component gets its own sub-model"""
+        return clone(self.model).fit(data, *args, **kwargs)
+
     def _score_core(
         self, series: Sequence[TimeSeries], *args, **kwargs
     ) -> Sequence[TimeSeries]:
         """Apply the scorer (sub) model scoring method on the series components"""
-        _ = _check_input(series, "series", width_expected=self.width_trained_on)
         if self.is_univariate or series[0].width == 1:
             # n series * (time, components, samples) -> (n series * (time - (window - 1)),)
             score_vals = self._model_score_method(
@@ -813,14 +858,15 @@ class WindowedAnomalyScorer(FittableAnomalyScorer):
                 score_iterator, verbose=False, desc=None, total=len(self.model)
             )
             # n series * (time, components, samples) -> (components, n series * (time - (window - 1)))
-            score_vals = np.array(
+            score_vals = np.stack(
                 _parallel_apply(
                     input_iterator,
                     self._model_score_method,
                     n_jobs=self._n_jobs,
                     fn_args=args,
                     fn_kwargs=kwargs,
-                )
+                ),
+                axis=0,
             )
         # (components, n series * (time - (window - 1))) -> n series * (time - (window - 1), components)
         score_series = self._convert_tabular_to_series(series, score_vals)
@@ -845,25 +891,29 @@ class WindowedAnomalyScorer(FittableAnomalyScorer):
         np.ndarray
             For `component_wise=True`, an array of shape (components, time - (window - 1), window).
             The component dimension is in first place for easy parallelization over all component-wise models.
+            For a single series, this is a read-only view on the series values.
             For `component_wise=False`, an array of shape (time - (window - 1), window * components).
         """
-        # n series * (time, components, sample) -> (time - (window - 1), window * components)
-        data = create_lagged_data(
-            target_series=series,
-            lags=[i for i in range(-self.window, 0)],
-            uses_static_covariates=False,
-            is_training=False,
-            concatenate=True,
-        )[0].squeeze(-1)
+        # n series * (time, components, sample) -> n series * (time - (window - 1), components, window);
+        # the windows are strided views on the series values
+        windows = [
+            sliding_window_view(
+                s.all_values(copy=False)[:, :, 0], window_shape=self.window, axis=0
+            )
+            for s in series
+        ]
 
         # bring into required model input shape
         if component_wise:
-            # (time - (window - 1), window * components) -> (time - (window - 1), window, components)
-            data = data.reshape((-1, self.window, series[0].width))
-            # (time - (window - 1), window, components) -> (components, time - (window - 1), window)
-            d_time, d_wind, d_comp = (0, 1, 2)
-            data = np.moveaxis(data, [d_time, d_comp], [d_wind, d_time])
-        return data
+            # n series * (time - (window - 1), components, window) -> n series * (components, time - (window - 1),
+            # window); remains a view, the data is only copied when concatenating multiple series
+            windows = [np.moveaxis(w, 1, 0) for w in windows]
+            return windows[0] if len(windows) == 1 else np.concatenate(windows, axis=1)
+
+        # n series * (time - (window - 1), components, window) -> (time - (window - 1), window * components);
+        # the windows are copied once into a contiguous array
+        data = np.concatenate([np.swapaxes(w, 1, 2) for w in windows], axis=0)
+        return data.reshape((len(data), -1))
 
     def _convert_tabular_to_series(
         self, series: Sequence[TimeSeries], score_vals: np.ndarray
@@ -883,24 +933,31 @@ class WindowedAnomalyScorer(FittableAnomalyScorer):
 
         # (components, n series * (time - (window - 1))) -> (n series * (time - (window - 1)), components)
         score_vals = score_vals.T
-        result = []
-        idx = 0
-        # (n series * (time - (window - 1)), components) -> n series * (time - (window - 1), components)
-        for s in series:
-            result.append(
+        window = self.window
+        if len(series) == 1:
+            # the scores all belong to the single series, no splitting required
+            s = series[0]
+            return [
                 getattr(s, create_fn)(
-                    times=s._time_index[self.window - 1 :],
-                    values=score_vals[idx : idx + len(s) - self.window + 1, :],
+                    times=s._time_index[window - 1 :], values=score_vals
                 )
+            ]
+
+        # (n series * (time - (window - 1)), components) -> n series * (time - (window - 1), components)
+        split_indices = np.cumsum([len(s) - window + 1 for s in series[:-1]])
+        return [
+            getattr(s, create_fn)(
+                times=s._time_index[window - 1 :],
+                values=vals,
             )
-            idx += len(s) - self.window + 1
-        return result
+            for s, vals in zip(series, np.split(score_vals, split_indices, axis=0))
+        ]
 
 
 class NLLScorer(AnomalyScorer):
     """Parent class for all LikelihoodScorer"""
 
-    def __init__(self, window) -> None:
+    def __init__(self, window, n_jobs: int = 1) -> None:
         """
         Parameters
         ----------
@@ -910,8 +967,12 @@ class NLLScorer(AnomalyScorer):
             indicating how anomalous these subset of W values are. A post-processing step will convert this anomaly
             score into a point-wise anomaly score (see definition of `window_transform`). The window size should be
             commensurate to the expected durations of the anomalies one is looking for.
+        n_jobs
+            The number of jobs to run in parallel. Parallel jobs are created only when a `Sequence[TimeSeries]` is
+            passed as input, parallelising operations regarding different `TimeSeries`. Defaults to `1`
+            (sequential). Setting the parameter to `-1` means using all the available processors.
         """
-        super().__init__(is_univariate=False, window=window)
+        super().__init__(is_univariate=False, window=window, n_jobs=n_jobs)
 
     @property
     def is_probabilistic(self) -> bool:
@@ -945,15 +1006,17 @@ class NLLScorer(AnomalyScorer):
         vals = self._extract_deterministic_values(vals, "series")
         self._assert_stochastic(pred_vals, "pred_series")
 
-        np_anomaly_scores = []
-        for component_idx in range(pred_vals.shape[1]):
-            np_anomaly_scores.append(
-                self._score_core_nllikelihood(
-                    vals[:, component_idx].squeeze(-1),
-                    pred_vals[:, component_idx],
-                )
+        # the components are scored in a plain loop: they are small NumPy computations for which spawning jobs
+        # costs more than it saves; `n_jobs` parallelizes over the series in `score_from_prediction()` instead
+        np_anomaly_scores = [
+            self._score_core_nllikelihood(
+                vals[:, component_idx].squeeze(-1),
+                pred_vals[:, component_idx],
             )
-        return np.array(np_anomaly_scores).T
+            for component_idx in range(pred_vals.shape[1])
+        ]
+        # components * (time,) -> (time, components)
+        return np.stack(np_anomaly_scores, axis=1)
 
     @abstractmethod
     def _score_core_nllikelihood(
@@ -115,17 +115,17 @@ class WassersteinScorer(WindowedAnomalyScorer):
         #     only one sample
         #     - check if there is an equivalent Wasserstein distance for d-D distributions (currently only accepts 1D)
 
-        if type(window) is int:  # noqa: E721
-            if window > 0 and window < 10:
-                logger.warning(
-                    f"The `window` parameter WassersteinScorer is smaller than 10 (w={window})."
-                    + " The value represents the window length rolled on the series given as"
-                    + " input in the `score` function. At each position, the w values will"
-                    + " constitute a subset, and the Wasserstein distance between the subset"
-                    + " and the train distribution will be computed. To better represent the"
-                    + " constituted test distribution, the window parameter should be larger"
-                    + " than 10."
-                )
+        # `bool` is a subclass of `int`, but is not a valid window
+        if isinstance(window, int) and not isinstance(window, bool) and 0 < window < 10:
+            logger.warning(
+                f"The `window` parameter WassersteinScorer is smaller than 10 (w={window})."
+                + " The value represents the window length rolled on the series given as"
+                + " input in the `score` function. At each position, the w values will"
+                + " constitute a subset, and the Wasserstein distance between the subset"
+                + " and the train distribution will be computed. To better represent the"
+                + " constituted test distribution, the window parameter should be larger"
+                + " than 10."
+            )
         super().__init__(
             is_univariate=(not component_wise),
             window=window,
@@ -147,4 +147,9 @@ class WassersteinScorer(WindowedAnomalyScorer):
 
     def _model_score_method(self, model, data: np.ndarray) -> np.ndarray:
         """Wrapper around model inference method"""
-        return [wasserstein_distance(model, window_samples) for window_samples in data]
+        # fill the scores directly into a float array, instead of inferring it from a list of Python floats
+        return np.fromiter(
+            (wasserstein_distance(model, window_samples) for window_samples in data),
+            dtype=np.float64,
+            count=len(data),
+        )
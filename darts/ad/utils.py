@@ -21,6 +21,7 @@ except ImportError:
 
 import matplotlib.pyplot as plt
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.metrics import (
     accuracy_score,
     average_precision_score,
@@ -637,6 +638,48 @@ def _max_pooling(series: TimeSeries, window: int) -> TimeSeries:
     )
 
 
+def _window_agg_values(vals: np.ndarray, window: int) -> np.ndarray:
+    """Computes the "look ahead" rolling mean of size `window` along the first (time) axis of `vals`.
+
+    The value at each time step is the mean of the values in the window starting at this time step. At the
+    end of the array, the windows are truncated and the mean is taken over the remaining values only.
+
+    Parameters
+    ----------
+    vals
+        The values to aggregate, of shape (time, components, samples).
+    window
+        Integer value indicating the size of the rolling window. If it is larger than the length of `vals`, all
+        windows are truncated.
+
+    Returns
+    -------
+    np.ndarray
+        The aggregated values, with the same shape and dtype as `vals`.
+    """
+    n_time = len(vals)
+    # number of windows fully contained in `vals`
+    n_full = max(n_time - window + 1, 0)
+    out = np.empty_like(vals)
+
+    # windows fully contained in `vals`: (n_full, components, samples, window) -> (n_full, components, samples);
+    # each window is reduced on its own, so that a non-finite or very large value only affects the windows
+    # containing it
+    if n_full:
+        np.sum(
+            sliding_window_view(vals, window_shape=window, axis=0),
+            axis=-1,
+            out=out[:n_full],
+        )
+        out[:n_full] /= window
+
+    # truncated windows at the end: mean over all remaining values
+    tail = vals[n_full:]
+    np.cumsum(tail[::-1], axis=0, out=out[n_full:][::-1])
+    out[n_full:] /= np.arange(len(tail), 0, -1)[:, None, None]
+    return out
+
+
 def _assert_same_length(
     list_series_1: Sequence[TimeSeries],
     list_series_2: Sequence[TimeSeries],
@@ -744,6 +787,7 @@ def _check_input(
                 ValueError(f"all series in `{name}` must be of type `TimeSeries`."),
                 logger=logger,
             )
+        width = s.width
         if check_deterministic and not s.is_deterministic:
             raise_log(
                 ValueError(
@@ -753,12 +797,12 @@ def _check_input(
             )
         if check_binary:
             _assert_binary(s, name=name)
-        if check_multivariate and s.width <= 1:
+        if check_multivariate and width <= 1:
             raise_log(
                 ValueError(f"all series in `{name}` must be multivariate (width>1)."),
                 logger=logger,
             )
-        if width_expected is not None and s.width != width_expected:
+        if width_expected is not None and width != width_expected:
             raise_log(
                 ValueError(
                     f"all series in `{name}` must have `{width_expected}` component(s) (width={width_expected})."
@@ -22,6 +22,7 @@ We also show how to use the `TFTExplainer` in the example notebook of the `TFTMo
 <https://unit8co.github.io/darts/examples/13-TFT-examples.html#Explainability>`_.
 """
 
+from functools import cached_property
 from typing import Dict, List, Optional, Sequence, Union
 
 import matplotlib.axes
@@ -204,24 +205,29 @@ class TFTExplainer(_ForecastingModelExplainer):
             past_covariates=foreground_past_covariates,
             future_covariates=foreground_future_covariates,
         )
-        # get the weights and the attention head from the trained model for the prediction
-        # aggregate over attention heads
+        # get the weights and the attention head from the trained model for the prediction;
+        # aggregate over attention heads, select the horizons and transpose to (n series, time, horizons)
+        # on the model's device, so that only the reduced attention is copied to the host
+        horizon_idx = [h - 1 for h in horizons]
         attention_heads = (
-            self.model.model._attn_out_weights.detach().cpu().numpy().sum(axis=-2)
+            self.model.model._attn_out_weights.detach()
+            .sum(dim=-2)[:, horizon_idx]
+            .transpose(1, 2)
+            .contiguous()
+            .cpu()
+            .numpy()
         )
         # get the variable importances (pd.DataFrame with rows corresponding to the number of input series)
         encoder_importance = self._encoder_importance
         decoder_importance = self._decoder_importance
         static_covariates_importance = self._static_covariates_importance
 
-        horizon_idx = [h - 1 for h in horizons]
-
         results = []
         icl = self.model.input_chunk_length
         for idx, (series, pred_series) in enumerate(zip(foreground_series, preds)):
             times = series.time_index[-icl:].union(pred_series.time_index)
             attention = TimeSeries.from_times_and_values(
-                values=np.take(attention_heads[idx], horizon_idx, axis=0).T,
+                values=attention_heads[idx],
                 times=times,
                 columns=[f"horizon {str(i)}" for i in horizons],
             )
@@ -497,24 +503,25 @@ class TFTExplainer(_ForecastingModelExplainer):
         if weight.ndim == 3:
             weight = weight.unsqueeze(1)
 
-        # transform the encoder/decoder weights to percentages, rounded to n_decimals
+        # transform the encoder/decoder weights to percentages, rounded to n_decimals; the time reduction
+        # happens in torch so that only the (n series, n variables) result is copied to the host
         weights_percentage = (
-            weight.detach().cpu().numpy().mean(axis=1).squeeze(axis=1).round(n_decimals)
+            weight.mean(dim=1).squeeze(dim=1).detach().cpu().numpy().round(n_decimals)
             * 100
         )
-        # create a dataframe with the variable names and the weights
+
+        # sort the variables by the importance of the first series before creating the dataframe
+        order = np.argsort(weights_percentage[0])
         name_mapping = self._name_mapping
-        importance = pd.DataFrame(
-            weights_percentage,
-            columns=[name_mapping[name] for name in names],
+        return pd.DataFrame(
+            weights_percentage[:, order],
+            columns=[name_mapping[names[idx]] for idx in order],
         )
 
-        # return the importance sorted descending
-        return importance.transpose().sort_values(0, ascending=True).transpose()
-
-    @property
+    @cached_property
     def _name_mapping(self) -> Dict[str, str]:
-        """Returns the feature name mapping of the TFT model.
+        """Returns the feature name mapping of the TFT model. The mapping is computed once, since the component
+        names do not change after the explainer was created.
 
         Returns
         -------
@@ -564,7 +571,7 @@ class TFTExplainer(_ForecastingModelExplainer):
         """
         if ax is None:
             _, ax = plt.subplots()
-        ax.barh(importance.columns.tolist(), importance.values[0].tolist())
+        ax.barh(importance.columns.values, importance.values[0])
         ax.set_title(title)
         ax.set_ylabel("Variable", fontsize=12)
         ax.set_xlabel("Variable importance in %")
@@ -706,7 +706,9 @@ def ae(
     y_true, y_pred = _get_values_or_raise(
         actual_series, pred_series, intersect, remove_nan_union=False
     )
-    return np.abs(y_true - y_pred)
+    # take the absolute value in-place to avoid a second pass over a new array
+    errors = y_true - y_pred
+    return np.abs(errors, out=errors)
 
 
 @multi_ts_support
@@ -194,6 +194,35 @@ class TestAnomalyDetectionScorer:
                 Sequence,
             )
 
+    @pytest.mark.parametrize(
+        "scorer_config",
+        [
+            (Norm, {"component_wise": False}),
+            (Difference, {}),
+            (GaussianNLLScorer, {"window": 3}),
+            (CauchyNLLScorer, {}),
+        ],
+    )
+    def test_score_from_pred_n_jobs(self, scorer_config):
+        # scoring a sequence of series in parallel gives the same results as scoring it sequentially
+        scorer_cls, scorer_kwargs = scorer_config
+        if issubclass(scorer_cls, NLLScorer):
+            series = [self.train, self.train + 1]
+            pred_series = [self.probabilistic, self.probabilistic]
+        else:
+            series = [self.test, self.mts_test]
+            pred_series = [self.modified_test, self.modified_mts_test]
+
+        scores = scorer_cls(n_jobs=1, **scorer_kwargs).score_from_prediction(
+            series, pred_series
+        )
+        scores_parallel = scorer_cls(n_jobs=2, **scorer_kwargs).score_from_prediction(
+            series, pred_series
+        )
+        assert len(scores_parallel) == len(scores)
+        for score_parallel, score in zip(scores_parallel, scores):
+            assert score_parallel == score
+
     @pytest.mark.parametrize("scorer_config", list_FittableAnomalyScorer)
     def test_score_return_type(self, scorer_config):
         scorer_cls, scorer_kwargs = scorer_config
@@ -1228,6 +1257,19 @@ class TestAnomalyDetectionScorer:
         else:
             assert np.abs(0.99007 - auc_roc_cwfalse) < delta
 
+    def test_componentwise_sub_models(self):
+        # each component must be fitted with its own sub-model
+        np.random.seed(1)
+        mts = TimeSeries.from_values(
+            np.random.normal(loc=[0, 10], scale=[0.1, 0.1], size=[100, 2])
+        )
+        scorer = KMeansScorer(window=3, k=2, component_wise=True)
+        scorer.fit(mts)
+        assert len(scorer.model) == 2
+        assert scorer.model[0] is not scorer.model[1]
+        assert np.abs(scorer.model[0].cluster_centers_.mean()) < 1.0
+        assert np.abs(scorer.model[1].cluster_centers_.mean() - 10) < 1.0
+
     def test_PyODScorer(self):
         # Check parameters and inputs
         self.component_wise_parameter(PyODScorer, model=KNN())
@@ -1685,6 +1727,73 @@ class TestAnomalyDetectionScorer:
         # same last value (by definition)
         assert score_T[-1] == score_F[-1]
 
+    @pytest.mark.parametrize("window", [2, 10])
+    def test_score_from_prediction_window_transform(self, window):
+        """Verify that the windowed scores of `score_from_prediction()` match a rolling mean `window_transform()`
+        of the point-wise scores, including time index and component names"""
+        for series, pred_series in [
+            (self.train, self.probabilistic),
+            (self.mts_train, self.mts_probabilistic),
+        ]:
+            score = GaussianNLLScorer(window=window).score_from_prediction(
+                series, pred_series
+            )
+            expected = GaussianNLLScorer(window=1).score_from_prediction(
+                series, pred_series
+            )
+            expected = expected.window_transform(
+                transforms={
+                    "window": window,
+                    "function": "mean",
+                    "mode": "rolling",
+                    "min_periods": window,
+                },
+                treat_na="dropna",
+            )
+            np.testing.assert_array_almost_equal(score.values(), expected.values())
+            assert score.time_index.equals(expected.time_index)
+            assert score.components.equals(expected.components)
+            assert score.dtype == expected.dtype
+
+    @pytest.mark.parametrize(
+        "scorer_cls,actual_value,pred_samples",
+        [
+            # near-zero variance of the samples -> very large score
+            (GaussianNLLScorer, 1.0, np.arange(20) * 1e-16),
+            # actual value outside of the support -> infinite score
+            (ExponentialNLLScorer, -1.0, np.arange(1, 21) / 10),
+        ],
+    )
+    def test_score_from_prediction_window_local(
+        self, scorer_cls, actual_value, pred_samples
+    ):
+        """Verify that a very large or infinite point-wise score only affects the windowed scores of the windows
+        containing it"""
+        window = 3
+        rng = np.random.RandomState(42)
+        vals = 2.0 + rng.rand(30)
+        pred_vals = rng.exponential(scale=2.0, size=(30, 1, 20))
+        vals[10] = actual_value
+        pred_vals[10, 0] = pred_samples
+        series = TimeSeries.from_values(vals)
+        pred_series = TimeSeries.from_values(pred_vals)
+
+        point_scores = scorer_cls(window=1).score_from_prediction(series, pred_series)
+        point_vals = point_scores.values()[:, 0]
+        assert np.isfinite(np.delete(point_vals, 10)).all()
+        assert not np.isfinite(point_vals[10]) or point_vals[10] > 1e20
+
+        scores = scorer_cls(window=window).score_from_prediction(series, pred_series)
+        expected = np.array([
+            point_vals[idx : idx + window].mean()
+            for idx in range(len(point_vals) - window + 1)
+        ])
+        np.testing.assert_allclose(scores.values()[:, 0], expected)
+        # only the windows containing the large score are affected
+        assert np.isfinite(scores.values()[:8]).all()
+        assert np.isfinite(scores.values()[11:]).all()
+        assert np.abs(scores.values()[11:]).max() < 1e3
+
     def test_fun_window_agg(self):
         """Verify that the anomaly score aggregation works as intented"""
         # window = 2, alternating anomaly scores
@@ -1731,3 +1840,80 @@ class TestAnomalyDetectionScorer:
             np.array([[8, 10, 12, 14, 15, 16, 17, 18, 19, 20]]).T,
         )
         assert aggreg_scores.time_index.equals(anomaly_scores.time_index)
+
+    @pytest.mark.parametrize("window", [8, 10, 15])
+    def test_window_agg_window_larger_than_scores(self, window):
+        """Verify that scoring with `window_agg=True` works when the window-wise scores are shorter than
+        the window"""
+        np.random.seed(42)
+        series = TimeSeries.from_values(np.random.rand(15))
+        scorer = KMeansScorer(window=window, k=1, window_agg=True)
+        scorer.fit(series)
+        scores = scorer.score(series)
+
+        scorer_window_wise = KMeansScorer(window=window, k=1, window_agg=False)
+        scorer_window_wise.fit(series)
+        vals = scorer_window_wise.score(series).all_values()
+        assert len(vals) == len(series) - window + 1
+        # every window is truncated, the aggregated score is the mean over the remaining scores
+        expected = np.array([vals[idx:].mean(axis=0) for idx in range(len(vals))])
+        np.testing.assert_array_almost_equal(scores.all_values(), expected)
+
+    @pytest.mark.parametrize("window", [1, 2, 5, 9, 10, 11, 20])
+    def test_fun_window_agg_multivariate_stochastic(self, window):
+        """Verify that the anomaly score aggregation is applied on each component and sample independently"""
+        np.random.seed(42)
+        scorer = KMeansScorer(window=window)
+        anomaly_scores = TimeSeries.from_values(np.random.rand(10, 3, 4))
+        aggreg_scores = scorer._fun_window_agg([anomaly_scores], window=window)[0]
+
+        vals = anomaly_scores.all_values()
+        expected = np.array([
+            vals[idx : idx + window].mean(axis=0) for idx in range(len(vals))
+        ])
+        np.testing.assert_array_almost_equal(aggreg_scores.all_values(), expected)
+        assert aggreg_scores.time_index.equals(anomaly_scores.time_index)
+        assert aggreg_scores.components.equals(anomaly_scores.components)
+
+    @pytest.mark.parametrize("value", [np.inf, np.nan, 1e20])
+    def test_fun_window_agg_local(self, value):
+        """Verify that a non-finite or very large score only affects the aggregated scores of the windows
+        containing it"""
+        window = 3
+        scorer = KMeansScorer(window=window)
+        vals = np.random.RandomState(42).rand(12)
+        vals[4] = value
+        aggreg_scores = scorer._fun_window_agg(
+            [TimeSeries.from_values(vals)], window=window
+        )[0]
+        expected = np.array([
+            vals[idx : idx + window].mean() for idx in range(len(vals))
+        ])
+        np.testing.assert_allclose(aggreg_scores.values()[:, 0], expected)
+        assert np.isfinite(aggreg_scores.values()[5:]).all()
+
+    @pytest.mark.parametrize("window", [1, 3, 12])
+    def test_fun_window_agg_sequence(self, window):
+        """Verify that aggregating a sequence of scores gives the same results as aggregating each score alone"""
+        np.random.seed(42)
+        scorer = KMeansScorer(window=window)
+        anomaly_scores = [
+            TimeSeries.from_values(np.random.rand(length, 2, 1)) for length in [10, 7]
+        ]
+        aggreg_scores = scorer._fun_window_agg(anomaly_scores, window=window)
+        assert len(aggreg_scores) == len(anomaly_scores)
+        for aggreg_score, anomaly_score in zip(aggreg_scores, anomaly_scores):
+            assert aggreg_score == scorer._fun_window_agg([anomaly_score], window)[0]
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_fun_window_agg_dtype(self, dtype):
+        """Verify that the anomaly score aggregation preserves the dtype of the scores"""
+        window = 3
+        scorer = KMeansScorer(window=window)
+        anomaly_scores = TimeSeries.from_values(np.arange(10, dtype=dtype))
+        aggreg_scores = scorer._fun_window_agg([anomaly_scores], window=window)[0]
+        assert aggreg_scores.dtype == dtype
+        np.testing.assert_array_almost_equal(
+            aggreg_scores.values(),
+            np.array([[1, 2, 3, 4, 5, 6, 7, 8, 8.5, 9]]).T,
+        )